@@ -7,7 +7,9 @@
 import warnings
 from typing import Dict, Optional, Union
 
+import dask.array as da
 import iris
+import numpy as np
 import numpy.ma as ma
 from iris.cube import Cube, CubeList
 from numpy import ndarray
@@ -20,17 +22,18 @@ from improver.calibration.utilities import (
     filter_non_matching_cubes,
     get_frt_hours,
 )
+from improver.metadata.constants import FLOAT_DTYPE, FLOAT_TYPES
 from improver.metadata.probabilistic import is_probability
 from improver.metadata.utilities import (
     create_new_diagnostic_cube,
     generate_mandatory_attributes,
 )
 from improver.utilities.common_input_handle import as_cubelist
-from improver.utilities.cube_manipulation import (
-    clip_cube_data,
-    collapsed,
-    get_dim_coord_names,
-)
+from improver.utilities.cube_manipulation import collapsed, get_dim_coord_names
+
+# Attributes that are expected to differ between otherwise consistent bias files,
+# and so are ignored when combining multiple bias values.
+VOLATILE_BIAS_ATTRIBUTES = ["history"]
 
 
 def evaluate_additive_error(
@@ -67,26 +70,138 @@ def evaluate_additive_error(
     return forecast_errors.data
 
 
+def _additive_correction_kernel(
+    forecast_data: ndarray,
+    bias_data: ndarray,
+    lower_bound: Optional[float] = None,
+    upper_bound: Optional[float] = None,
+) -> ndarray:
+    """Subtract the bias from the forecast array and remap values beyond the
+    lower and upper bounds to the bound values, which are applied in-place.
+
+    Args:
+        forecast_data:
+            Array containing the forecast values.
+        bias_data:
+            Array containing the bias values, matching the trailing dimensions
+            of the forecast array.
+        lower_bound:
+            A lower bound below which all values will be remapped to.
+        upper_bound:
+            An upper bound above which all values will be remapped to.
+
+    Returns:
+        Array containing the bias-corrected forecast values.
+    """
+    # The bias is broadcast over the leading (ensemble) dimensions of the forecast
+    # array, avoiding the intermediate cube that iris arithmetic would create.
+    corrected_data = forecast_data - bias_data
+    if lower_bound is not None:
+        np.maximum(corrected_data, lower_bound, out=corrected_data)
+    if upper_bound is not None:
+        np.minimum(corrected_data, upper_bound, out=corrected_data)
+    return corrected_data
+
+
+def _check_bias_grid_matches_forecast(forecast: Cube, bias: Cube) -> None:
+    """Check that the bias is defined on the same spatial grid as the forecast,
+    with the spatial dimensions in the same (trailing) positions.
+
+    Args:
+        forecast:
+            Cube containing the forecast to which bias correction is to be applied.
+        bias:
+            Cube containing the bias values to apply to the forecast.
+
+    Raises:
+        ValueError: If the x or y coordinates of the bias do not match those of
+            the forecast, or are associated with different trailing dimensions.
+    """
+    for axis in ["x", "y"]:
+        forecast_coords = forecast.coords(axis=axis)
+        bias_coords = bias.coords(axis=axis)
+        if bias_coords != forecast_coords:
+            raise ValueError(
+                f"The {axis} coordinate of the bias data does not match that of "
+                "the forecast."
+            )
+        for forecast_coord, bias_coord in zip(forecast_coords, bias_coords):
+            forecast_dims = [
+                dim - forecast.ndim for dim in forecast.coord_dims(forecast_coord)
+            ]
+            bias_dims = [dim - bias.ndim for dim in bias.coord_dims(bias_coord)]
+            if forecast_dims != bias_dims:
+                raise ValueError(
+                    f"The {axis} coordinate of the bias data is not associated with "
+                    "the same dimension as that of the forecast."
+                )
+
+
 def apply_additive_correction(
-    forecast: Cube, bias: Cube, fill_masked_bias_values: bool = True
+    forecast: Cube,
+    bias: Cube,
+    fill_masked_bias_values: bool = True,
+    lower_bound: Optional[float] = None,
+    upper_bound: Optional[float] = None,
 ) -> ndarray:
     """
     Apply additive correction to forecast using the specified bias values,
     where the bias is expected to be defined as forecast - truth.
 
+    Where either the forecast or bias data is lazy, the correction is mapped
+    over the dask chunks, so that each chunk is corrected in a single task
+    with evaluation deferred until the data is required.
+
     Args:
         forecast:
             Cube containing the forecast to which bias correction is to be applied.
         bias:
             Cube containing the bias values to apply to the forecast.
+        fill_masked_bias_values:
+            Flag to specify whether masked areas in the bias data should be
+            filled with zero, leaving the forecast unchanged in these areas.
+        lower_bound:
+            A lower bound below which all corrected values will be remapped to.
+        upper_bound:
+            An upper bound above which all corrected values will be remapped to.
 
     Returns:
-        An array containing the corrected forecast values.
+        An array containing the corrected forecast values. This will be a lazy
+        array if either the forecast or bias data is lazy.
+
+    Raises:
+        ValueError: If the bias is not defined on the same spatial grid as the
+            forecast.
     """
-    if fill_masked_bias_values and isinstance(bias.data, ma.masked_array):
-        bias.data = ma.MaskedArray.filled(bias.data, 0.0)
-    corrected_forecast = forecast - bias
-    return corrected_forecast.data
+    _check_bias_grid_matches_forecast(forecast, bias)
+
+    forecast_data = forecast.core_data()
+    bias_data = bias.core_data()
+    if fill_masked_bias_values:
+        if bias.has_lazy_data():
+            bias_data = da.ma.filled(bias_data, 0.0)
+        elif isinstance(bias_data, ma.masked_array):
+            # Fill into a new array, leaving the input bias data unmodified. The
+            # bias only spans the spatial dimensions, so this copy is small
+            # relative to the forecast.
+            bias_data = ma.filled(bias_data, 0.0)
+    if np.issubdtype(forecast_data.dtype, np.floating):
+        # Cast the bias once to the forecast precision to avoid promoting the
+        # full forecast array to a wider type during the subtraction.
+        bias_data = bias_data.astype(forecast_data.dtype, copy=False)
+
+    if forecast.has_lazy_data() or bias.has_lazy_data():
+        return da.map_blocks(
+            _additive_correction_kernel,
+            da.asarray(forecast_data),
+            da.asarray(bias_data),
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            dtype=np.result_type(forecast_data.dtype, bias_data.dtype),
+        )
+    return _additive_correction_kernel(
+        forecast_data, bias_data, lower_bound, upper_bound
+    )
 
 
 class CalculateForecastBias(BasePlugin):
@@ -309,12 +424,18 @@ class ApplyBiasCorrection(BasePlugin):
         """
         Evaluate the mean bias from the input cube(s) in bias_values.
 
+        Where a single cube is provided with a scalar forecast_reference_time
+        coordinate, this is returned unchanged. A single cube containing a
+        forecast_reference_time dimension is treated as a series of bias values.
+
         Where multiple cubes are provided, each bias value must represent
         a single forecast_reference_time to ensure that the resultant value
         is the true mean over the set of reference forecasts. This is done
         by checking the forecast_reference_time bounds; if a bias_value is
         defined over a range of frt values (ie. bounds exist) an error will
-        be raised.
+        be raised. Volatile attributes, such as history, are not retained on the
+        mean bias; if any other attributes differ between the bias cubes an error
+        will be raised.
 
         Args:
             bias_values:
@@ -324,8 +445,12 @@ class ApplyBiasCorrection(BasePlugin):
             Cube containing the mean bias evaluated from set of bias_values.
         """
         # Currently only support for cases where the input bias_values are defined
-        # over a single forecast_reference_time.
-        if len(bias_values) == 1:
+        # over a single forecast_reference_time. Where the bias has already been
+        # reduced to a single value there is no mean to evaluate, so return it
+        # directly without merging.
+        if len(bias_values) == 1 and "forecast_reference_time" not in (
+            get_dim_coord_names(bias_values[0])
+        ):
             return bias_values[0]
         else:
             # Loop over bias_values and check bounds on each cube.
@@ -337,13 +462,54 @@ class ApplyBiasCorrection(BasePlugin):
                         f"for frt: {bias_cube.coord('forecast_reference_time').points} has bounds"
                         f"{bias_cube.coord('forecast_reference_time').bounds}, expected {None}."
                     )
+            # Remove volatile attributes (e.g. history) from copies of the bias
+            # cubes, sharing the input data, so that bias values that differ only
+            # in these can be merged in one step. Other attributes must match.
+            bias_values = CubeList(
+                cube.copy(data=cube.core_data()) for cube in bias_values
+            )
+            for bias_cube in bias_values:
+                for attribute in VOLATILE_BIAS_ATTRIBUTES:
+                    bias_cube.attributes.pop(attribute, None)
+            for bias_cube in bias_values[1:]:
+                if bias_cube.attributes != bias_values[0].attributes:
+                    raise ValueError(
+                        "Bias values have differing attributes and cannot be "
+                        f"combined. Attributes {dict(bias_values[0].attributes)} and "
+                        f"{dict(bias_cube.attributes)} do not match."
+                    )
             bias_values = bias_values.merge_cube()
             frt_coord = create_unified_frt_coord(
                 bias_values.coord("forecast_reference_time")
             )
-            mean_bias = collapsed(
-                bias_values, "forecast_reference_time", iris.analysis.MEAN
+            # Evaluate the mean as a single reduction over the underlying array and
+            # attach the result to a single frt slice, rather than collapsing the cube.
+            (frt_dim,) = bias_values.coord_dims("forecast_reference_time")
+            for coord in bias_values.coords(contains_dimension=frt_dim):
+                if len(bias_values.coord_dims(coord)) > 1:
+                    raise ValueError(
+                        "Collapsing multiple bias values to a mean value is "
+                        "unsupported for bias values with multi-dimensional "
+                        f"coordinates spanning forecast_reference_time: {coord.name()}."
+                    )
+            bias_data = bias_values.core_data()
+            if bias_values.has_lazy_data():
+                # Merging lazy cubes gives one chunk per forecast_reference_time;
+                # use a single chunk along this dimension so that the mean is
+                # evaluated blockwise rather than through a tree of tiny chunks.
+                bias_data = bias_data.rechunk({frt_dim: -1})
+            mean_data = bias_data.mean(axis=frt_dim)
+            # Demote escalated datatypes, consistent with collapsed.
+            if mean_data.dtype in FLOAT_TYPES:
+                mean_data = mean_data.astype(FLOAT_DTYPE, copy=False)
+            mean_bias = next(bias_values.slices_over("forecast_reference_time")).copy(
+                data=mean_data
             )
+            # Collapse any other coordinates varying with forecast_reference_time
+            # (e.g. blend_time) to a single bounded value, as collapsed would.
+            for coord in bias_values.coords(dimensions=frt_dim):
+                if coord.name() != "forecast_reference_time":
+                    mean_bias.replace_coord(coord.collapsed())
             mean_bias.replace_coord(frt_coord)
             return mean_bias
 
@@ -412,6 +578,9 @@ class ApplyBiasCorrection(BasePlugin):
 
         If no bias correction is provided, then the forecast is returned, unaltered.
 
+        Where the input forecast or bias data is lazy, the bias-corrected data will
+        also be lazy, with evaluation deferred until the data is required.
+
         Args:
             cubes:
                 A list of cubes containing:
@@ -433,14 +602,12 @@ class ApplyBiasCorrection(BasePlugin):
         self._check_forecast_bias_consistent(forecast, bias_cubes)
         bias = self._get_mean_bias(bias_cubes)
 
-        corrected_forecast = forecast.copy()
-        corrected_forecast.data = self._correction_method(
-            forecast, bias, self._fill_masked_bias_values
+        corrected_data = self._correction_method(
+            forecast,
+            bias,
+            self._fill_masked_bias_values,
+            self._lower_bound,
+            self._upper_bound,
         )
 
-        if (self._lower_bound is not None) or (self._upper_bound is not None):
-            corrected_forecast = clip_cube_data(
-                corrected_forecast, self._lower_bound, self._upper_bound
-            )
-
-        return corrected_forecast
+        return forecast.copy(data=corrected_data)
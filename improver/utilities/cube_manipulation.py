@@ -5,7 +5,7 @@
 """Provides support utilities for cube manipulation."""
 
 import warnings
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import iris
 import numpy as np
@@ -396,14 +396,15 @@ def compare_attributes(
 
 
 def compare_coords(
-    cubes: CubeList, ignored_coords: Optional[List[str]] = None
+    cubes: Iterable[Cube], ignored_coords: Optional[List[str]] = None
 ) -> List[Dict]:
     """
     Function to compare the coordinates of the cubes
 
     Args:
         cubes:
-            List of cubes to compare (must be more than 1)
+            Cubes to compare (must be more than 1). Any iterable of cubes,
+            such as a CubeList, list or tuple, may be provided.
         ignored_coords:
             List of coordinate names that identify coordinates to exclude from
             the comparison.
@@ -417,47 +418,48 @@ def compare_coords(
     Warns:
         Warning: If only a single cube is supplied
     """
-    if ignored_coords is None:
-        ignored_coords = []
-
-    unmatching_coords = []
+    cubes = tuple(cubes)
     if len(cubes) == 1:
         msg = "Only a single cube so no differences will be found "
         warnings.warn(msg)
-    else:
-        common_coords = cubes[0].coords()
-        for cube in cubes[1:]:
-            cube_coords = cube.coords()
-            common_coords = [
-                coord
-                for coord in common_coords
-                if (
-                    coord in cube_coords
-                    and np.all(cube.coords(coord) == cubes[0].coords(coord))
-                )
-            ]
-
-        for i, cube in enumerate(cubes):
-            unmatching_coords.append({})
-            for coord in cube.coords():
-                if coord not in common_coords and coord.name() not in ignored_coords:
-                    dim_coords = cube.dim_coords
-                    if coord in dim_coords:
-                        dim_val = dim_coords.index(coord)
-                    else:
-                        dim_val = None
-                    aux_val = None
-                    if dim_val is None and len(cube.coord_dims(coord)) > 0:
-                        aux_val = cube.coord_dims(coord)[0]
-                    unmatching_coords[i].update(
-                        {
-                            coord.name(): {
-                                "data_dims": dim_val,
-                                "aux_dims": aux_val,
-                                "coord": coord,
-                            }
-                        }
-                    )
+        return []
+
+    if ignored_coords is None:
+        ignored_coords = []
+
+    # Map coordinate names to coordinates once per cube so that coordinates
+    # can be matched by lookup, rather than by scanning each cube's coords.
+    coord_maps = [{coord.name(): coord for coord in cube.coords()} for cube in cubes]
+    # Only coordinates with a name found on every cube can be common, and these
+    # must also match in value across the cubes.
+    shared_names = frozenset(coord_maps[0]).intersection(*coord_maps[1:])
+    common_coords = {
+        name
+        for name in shared_names
+        if all(coord_map[name] == coord_maps[0][name] for coord_map in coord_maps[1:])
+    }
+    excluded_coords = common_coords.union(ignored_coords)
+
+    dim_indices = [
+        {coord.name(): dim for dim, coord in enumerate(cube.dim_coords)}
+        for cube in cubes
+    ]
+    unmatching_coords = [
+        {
+            name: {
+                "data_dims": dim_indices[i].get(name),
+                "aux_dims": (
+                    None
+                    if name in dim_indices[i]
+                    else (cube.coord_dims(coord) or (None,))[0]
+                ),
+                "coord": coord,
+            }
+            for name, coord in coord_maps[i].items()
+            if name not in excluded_coords
+        }
+        for i, cube in enumerate(cubes)
+    ]
 
     return unmatching_coords
 
@@ -153,6 +153,61 @@ def test_apply_additive_correction(
         assert np.allclose(result, expected, atol=0.05)
 
 
+def test_apply_additive_correction_bias_unmodified(forecast_cube):
+    """Test that filling the masked bias values does not modify the input bias
+    data, or any array it shares memory with."""
+    source_data = MEAN_BIAS_DATA.copy()
+    bias_cube = generate_bias_cubelist(1, masked_data=True)[0]
+    bias_cube.data = ma.masked_array(source_data, mask=MASK)
+    expected_data = bias_cube.data.copy()
+
+    apply_additive_correction(forecast_cube, bias_cube, fill_masked_bias_values=True)
+
+    np.testing.assert_array_equal(source_data, MEAN_BIAS_DATA)
+    np.testing.assert_array_equal(bias_cube.data.data, expected_data.data)
+    np.testing.assert_array_equal(bias_cube.data.mask, MASK)
+
+
+@pytest.mark.parametrize("axis", ("x", "y"))
+def test_apply_additive_correction_mismatched_grid(forecast_cube, axis):
+    """Test that an error is raised if the bias is defined on a different grid
+    to the forecast."""
+    bias_cube = generate_bias_cubelist(1)[0]
+    bias_coord = bias_cube.coord(axis=axis)
+    bias_coord.points = bias_coord.points + 1.0
+
+    with pytest.raises(ValueError, match=f"The {axis} coordinate of the bias data"):
+        apply_additive_correction(forecast_cube, bias_cube)
+
+
+def test_apply_additive_correction_transposed_grid():
+    """Test that an error is raised if the bias spatial dimensions are in a
+    different order to those of the forecast, for a square grid."""
+    forecast_cube = set_up_variable_cube(np.ones((4, 3, 3), dtype=np.float32))
+    bias_x = forecast_cube.coord(axis="x")
+    bias_y = forecast_cube.coord(axis="y")
+    bias_cube = Cube(
+        np.zeros((3, 3), dtype=np.float32),
+        long_name="forecast_error_of_air_temperature",
+        units="K",
+        dim_coords_and_dims=[(bias_x.copy(), 0), (bias_y.copy(), 1)],
+    )
+
+    with pytest.raises(ValueError, match="not associated with the same dimension"):
+        apply_additive_correction(forecast_cube, bias_cube)
+
+
+def test_apply_additive_correction_bias_dtype(forecast_cube):
+    """Test that float64 bias values do not promote the float32 forecast."""
+    bias_cube = generate_bias_cubelist(1)[0]
+    bias_cube.data = bias_cube.data.astype(np.float64)
+
+    result = apply_additive_correction(forecast_cube, bias_cube)
+
+    assert result.dtype == np.float32
+    assert np.allclose(result, TEST_FCST_DATA - MEAN_BIAS_DATA)
+
+
 def test__init__():
     """Test that the class functions are set to the expected values."""
     plugin = ApplyBiasCorrection()
@@ -176,6 +231,89 @@ def test_get_mean_bias(single_input_frt):
     assert result.dtype == input_cubelist[0].dtype
 
 
+def test_get_mean_bias_float64():
+    """Test that a float64 bias input gives a float32 mean bias, consistent with
+    the demotion applied by collapsed."""
+    input_cubelist = generate_bias_cubelist(30)
+    for cube in input_cubelist:
+        cube.data = cube.data.astype(np.float64)
+    result = ApplyBiasCorrection()._get_mean_bias(input_cubelist)
+
+    assert result.dtype == np.float32
+    assert np.allclose(result.data, MEAN_BIAS_DATA, atol=0.05)
+
+
+def test_get_mean_bias_collapses_frt_dependent_coords():
+    """Test that coordinates varying along forecast_reference_time, other than
+    forecast_reference_time itself, match the result of collapsing the cube."""
+    input_cubelist = generate_bias_cubelist(3)
+    for cube in input_cubelist:
+        blend_time = cube.coord("forecast_reference_time").copy()
+        blend_time.rename("blend_time")
+        cube.add_aux_coord(blend_time)
+    expected = collapsed(
+        input_cubelist.merge_cube(), "forecast_reference_time", iris.analysis.MEAN
+    )
+
+    result = ApplyBiasCorrection()._get_mean_bias(input_cubelist)
+
+    assert result.coord("blend_time") == expected.coord("blend_time")
+    assert result.coord("blend_time").has_bounds()
+    assert result.coord("forecast_period") == expected.coord("forecast_period")
+    assert result.cell_methods == expected.cell_methods
+    assert result.attributes == expected.attributes
+    assert result.dtype == expected.dtype
+    assert np.allclose(result.data, expected.data)
+
+
+def test_get_mean_bias_single_input():
+    """Test that a single bias cube with a scalar forecast_reference_time is
+    returned unchanged, while a single cube with a forecast_reference_time
+    dimension is reduced to the mean value."""
+    input_cubelist = generate_bias_cubelist(30, single_frt_with_bounds=True)
+    result = ApplyBiasCorrection()._get_mean_bias(input_cubelist)
+    assert result is input_cubelist[0]
+
+    input_cubelist = CubeList([generate_bias_cubelist(30).merge_cube()])
+    result = ApplyBiasCorrection()._get_mean_bias(input_cubelist)
+    assert "forecast_reference_time" not in get_dim_coord_names(result)
+    assert result.coord("forecast_reference_time").has_bounds()
+    assert np.allclose(result.data, MEAN_BIAS_DATA, atol=0.05)
+
+
+def test_get_mean_bias_differing_attributes():
+    """Test that bias values with differing history attributes can be combined,
+    with the history removed from the mean bias cube but not from the inputs,
+    while bias values with other differing attributes are rejected."""
+    input_cubelist = generate_bias_cubelist(3)
+    for i, cube in enumerate(input_cubelist):
+        cube.attributes["history"] = f"bias file {i}"
+    result = ApplyBiasCorrection()._get_mean_bias(input_cubelist)
+
+    assert "history" not in result.attributes
+    assert result.attributes["title"] == "Forecast bias data"
+    assert np.allclose(result.data, MEAN_BIAS_DATA, atol=0.1)
+    for i, cube in enumerate(input_cubelist):
+        assert cube.attributes["history"] == f"bias file {i}"
+
+    input_cubelist[-1].attributes["mosg__model_configuration"] = "gl_det"
+    with pytest.raises(ValueError, match="differing attributes"):
+        ApplyBiasCorrection()._get_mean_bias(input_cubelist)
+
+
+def test_get_mean_bias_lazy():
+    """Test that lazy bias values give a lazy mean bias with the expected
+    values."""
+    input_cubelist = generate_bias_cubelist(30)
+    for cube in input_cubelist:
+        cube.data = cube.lazy_data()
+    result = ApplyBiasCorrection()._get_mean_bias(input_cubelist)
+
+    assert result.has_lazy_data()
+    assert result.dtype == input_cubelist[0].dtype
+    assert np.allclose(result.data, MEAN_BIAS_DATA, atol=0.05)
+
+
 @pytest.mark.parametrize("single_input_frt", (True, False))
 def test_get_mean_bias_fails_on_inconsistent_bounds(single_input_frt):
     """Test that get_mean_bias fails when passing in multiple bias values defined
@@ -309,6 +447,31 @@ def test_process(
     assert result.attributes == forecast_cube.attributes
 
 
+@pytest.mark.parametrize("num_bias_inputs", (1, 30))
+@pytest.mark.parametrize("lower_bound", (None, 1))
+@pytest.mark.parametrize("upper_bound", (None, 4))
+def test_process_lazy(forecast_cube, num_bias_inputs, lower_bound, upper_bound):
+    """Test that lazy inputs give a lazy result with the expected values."""
+    input_bias_cubelist = generate_bias_cubelist(num_bias_inputs)
+    forecast_cube.data = forecast_cube.lazy_data()
+    for bias_cube in input_bias_cubelist:
+        bias_cube.data = bias_cube.lazy_data()
+
+    result = ApplyBiasCorrection(
+        lower_bound=lower_bound, upper_bound=upper_bound
+    ).process(forecast_cube, input_bias_cubelist)
+
+    expected = TEST_FCST_DATA - MEAN_BIAS_DATA
+    if lower_bound is not None:
+        expected = np.maximum(lower_bound, expected)
+    if upper_bound is not None:
+        expected = np.minimum(upper_bound, expected)
+
+    assert result.has_lazy_data()
+    assert result.dtype == forecast_cube.dtype
+    assert np.allclose(result.data, expected, atol=0.05)
+
+
 class HaltExecution(Exception):
     pass
 
@@ -7,6 +7,7 @@ Unit tests for the function "cube_manipulation.compare_coords".
 """
 
 import unittest
+from functools import lru_cache
 
 import iris
 import numpy as np
@@ -17,13 +18,19 @@ from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
 from improver.utilities.cube_manipulation import compare_coords
 
 
+@lru_cache(maxsize=1)
+def _base_cube():
+    """Set up the temperature cube once; tests use copies of this cube."""
+    data = np.full((3, 3, 3), 275.0, dtype=np.float32)
+    return set_up_variable_cube(data)
+
+
 class Test_compare_coords(unittest.TestCase):
     """Test the compare_coords utility."""
 
     def setUp(self):
         """Use temperature cube to test with."""
-        data = 275 * np.ones((3, 3, 3), dtype=np.float32)
-        self.cube = set_up_variable_cube(data)
+        self.cube = _base_cube().copy()
         self.extra_dim_coord = DimCoord(
             np.array([5.0], dtype=np.float32), standard_name="height", units="m"
         )
@@ -40,6 +47,15 @@ class Test_compare_coords(unittest.TestCase):
         self.assertIsInstance(result, list)
         self.assertEqual(result, [{}, {}])
 
+    def test_tuple_input(self):
+        """Test that the utility accepts a tuple of cubes."""
+        cube1 = self.cube.copy()
+        cube2 = self.cube.copy()
+        cube2.add_aux_coord(self.extra_aux_coord, data_dims=0)
+        result = compare_coords((cube1, cube2))
+        self.assertEqual(len(result[0]), 0)
+        self.assertEqual(list(result[1]), ["model"])
+
     def test_catch_warning(self):
         """Test warning is raised if the input is cubelist of length 1."""
         cube = self.cube.copy()
@@ -112,6 +128,26 @@ class Test_compare_coords(unittest.TestCase):
         self.assertEqual(result[1]["model"]["data_dims"], None)
         self.assertEqual(result[1]["model"]["aux_dims"], 0)
 
+    def test_coordinate_with_differing_points(self):
+        """Test for comparing coordinate between cubes, where both cubes
+        have a coordinate of the same name but with different points. The
+        coordinate is expected to be returned as unmatching for both cubes."""
+        cube1 = self.cube.copy()
+        cube2 = self.cube.copy()
+        cube2.coord("forecast_period").points = (
+            cube2.coord("forecast_period").points + 3600
+        )
+        cubelist = iris.cube.CubeList([cube1, cube2])
+        result = compare_coords(cubelist)
+        self.assertEqual(list(result[0]), ["forecast_period"])
+        self.assertEqual(list(result[1]), ["forecast_period"])
+        self.assertEqual(
+            result[0]["forecast_period"]["coord"], cube1.coord("forecast_period")
+        )
+        self.assertEqual(
+            result[1]["forecast_period"]["coord"], cube2.coord("forecast_period")
+        )
+
     def test_second_cube_has_extra_ignored_coordinate(self):
         """Test for comparing coordinate between cubes, where the second
         cube in the list has an extra dimension coordinate which is